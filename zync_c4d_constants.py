@@ -47,7 +47,7 @@ C4DTOA_MSG_TYPE = 1000
 C4DTOA_MSG_GET_VERSION = 1040
 C4DTOA_MSG_RESP1 = 2011
 VRAY_BRIDGE_PLUGIN_ID = 1019782
-REDSHIFT_VIDEOPOSTS = [1036219, 1040189]
+REDSHIFT_VIDEOPOSTS = frozenset([1036219, 1040189])
 
 RDATA_RENDERENGINE_ARNOLD = 1029988
 RDATA_RENDERENGINE_REDSHIFT = 1036219
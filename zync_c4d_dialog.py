@@ -101,44 +101,32 @@ class ZyncDialog(zync_threading.MainThreadCaller, c4d.gui.GeDialog):
     self.LayoutChanged(SYMBOLS['DIALOG_TOP_GROUP'])
 
   @main_thread
-  def add_button_to_group(self, widget_group_name, caption, index):
+  def fill_checkbox_group(self, widget_group_name, checkbox_group_name, button_group_name,
+                          button_caption, entries):
     """
-    Adds new button to the widget group.
+    Replaces the content of the widget group with checkboxes, each followed by a button or a filler.
 
-    :param str widget_group_name: Name of the widget group.
-    :param str caption: Button caption.
-    :param int index: Index within the group.
-    """
-    self.AddButton(SYMBOLS[widget_group_name] + index, 0, name=caption)
-
-  @main_thread
-  def add_checkbox_to_group(self, widget_group_name, caption, index):
-    """
-    Adds new checkbox to the widget group.
-    
-    :param str widget_group_name: Name of the widget group.
-    :param str caption: Checkbox caption.
-    :param int index: Index within the group.
-    """
-    self.AddCheckbox(SYMBOLS[widget_group_name] + index, c4d.BFH_LEFT, 0, 0, name=caption)
-
-  @main_thread
-  def add_filler(self):
-    """ Adds new filler. """
-    self.AddStaticText(0, 0)
-
-  @contextmanager
-  def change_layout(self, widget_group_name):
-    """
-    Returns a context manager for changing the layout of the widget group.
-
-    It clears the widget group on enter and notifies C4D about the changes on exit.
+    All widgets are added in a single main thread call and C4D is notified about the layout
+    change once, after the last widget is added.
 
     :param str widget_group_name: Name of the widget group.
+    :param str checkbox_group_name: Name of the checkbox group.
+    :param str button_group_name: Name of the button group.
+    :param str button_caption: Caption of the buttons.
+    :param collections.Iterable[(str, bool, bool)] entries: Checkbox caption, checkbox value
+      and whether the checkbox is followed by a button.
     """
-    self.run_on_main_thread(lambda: self.LayoutFlushGroup(SYMBOLS[widget_group_name]))
-    yield
-    self.run_on_main_thread(lambda: self.LayoutChanged(SYMBOLS[widget_group_name]))
+    checkbox_base_id = SYMBOLS[checkbox_group_name]
+    button_base_id = SYMBOLS[button_group_name]
+    self.LayoutFlushGroup(SYMBOLS[widget_group_name])
+    for index, (caption, checked, has_button) in enumerate(entries):
+      self.AddCheckbox(checkbox_base_id + index, c4d.BFH_LEFT, 0, 0, name=caption)
+      self.SetBool(checkbox_base_id + index, checked)
+      if has_button:
+        self.AddButton(button_base_id + index, 0, name=button_caption)
+      else:
+        self.AddStaticText(0, 0)
+    self.LayoutChanged(SYMBOLS[widget_group_name])
 
   @contextmanager
   def change_menu(self):
@@ -210,11 +198,6 @@ class ZyncDialog(zync_threading.MainThreadCaller, c4d.gui.GeDialog):
     """ Sets the boolean value of the widget. """
     self.SetBool(SYMBOLS[widget_name], value)
 
-  @main_thread
-  def set_group_bool(self, widget_group_name, value, index):
-    """ Sets the boolean value of a child widget of the group at the index. """
-    self.SetBool(SYMBOLS[widget_group_name] + index, value)
-
   @main_thread
   def set_int32(self, widget_name, value, min_value=None, max_value=None):
     """
@@ -4,7 +4,6 @@ from importlib import import_module
 from zync_c4d_scene_settings import C4dSceneSettings
 import zync_c4d_utils
 
-zync = zync_c4d_utils.import_zync_module('zync')
 zync_threading = zync_c4d_utils.import_zync_module('zync_threading')
 main_thread = zync_threading.MainThreadCaller.main_thread
 c4d = import_module('c4d')
@@ -1,6 +1,10 @@
 """ Contains JobPresenter class. """
+from __future__ import print_function
+
+import operator
 import os
 import re
+import stat
 import traceback
 
 import time
@@ -15,22 +19,40 @@ from zync_c4d_pvm_consent_dialog import get_pvm_consent_from_the_user
 from zync_c4d_render_settings import C4dRenderFormatUnsupportedException
 from zync_c4d_render_settings import C4dRendererSettingsUnavailableException
 from zync_c4d_utils import import_zync_module
-from zync_c4d_vray_exporter import VRayExporter
 from zync_c4d_vray_settings import C4dVrayVersionException
 
 SYMBOLS = zync_c4d_constants.SYMBOLS
 from zync_c4d_presenter import Presenter
 
 zync = import_zync_module('zync')
-zync_preflights = import_zync_module('zync_preflights')
-common_preflights = import_zync_module('zync_preflights.common_checks')
+zync_threading = import_zync_module('zync_threading')
+async_call = zync_threading.AsyncCaller.async_call
+
+# params passed through to V-Ray jobs
+_VRAY_COPY_KEYS = (
+    'renderer', 'plugin_version', 'num_instances', 'instance_type',
+    'proj_name', 'job_subtype', 'priority', 'notify_complete',
+    'upload_only', 'xres', 'yres', 'chunk_size', 'scene_info',
+    'take', 'output_dir', 'output_name',
+    'format', 'frame_begin', 'frame_end', 'step'
+)
+_VRAY_COPY_GET = operator.itemgetter(*_VRAY_COPY_KEYS)
+
+_PATH_SEPARATORS = tuple(sep for sep in (os.sep, os.altsep) if sep)
+_SEPARATOR_RUN_RE = re.compile('[%s]+' % re.escape(''.join(_PATH_SEPARATORS)))
+
+_PRESET_RE = re.compile(r'preset://([^/]+)/')
+
+_ARNOLD = zync_c4d_constants.RendererNames.ARNOLD
+_REDSHIFT = zync_c4d_constants.RendererNames.REDSHIFT
+_VRAY = zync_c4d_constants.RendererNames.VRAY
 
 
 class ValidationError(Exception):
   """ Error in user-specified parameters or scene settings. """
 
 
-class JobPresenter(Presenter):
+class JobPresenter(Presenter, zync_threading.AsyncCaller):
   """
   Implements presenter for job view.
 
@@ -41,12 +63,15 @@ class JobPresenter(Presenter):
   :param zync_c4d_scene_settings.C4dSceneSettings scene_settings:
   :param zync_c4d_facade.C4dFacade c4d_facade:
   :param zync_threading.default_hread_pool.DefaultThreadPool thread_pool:
+  :param zync_threading.thread_synchronization.ThreadSynchronizationFactory thread_synchronization_factory:
   :param zync_threading.MainThreadExecutor main_thread_executor:
   """
 
   # list of widgets that should be disabled for upload only jobs
   RENDER_ONLY_SETTINGS = ['JOB_SETTINGS_G', 'VMS_SETTINGS_G', 'FRAMES_G',
                           'RENDER_G', 'TAKE']
+  # list of widgets that are locked while a job is being submitted
+  SUBMISSION_LOCKED_SETTINGS = RENDER_ONLY_SETTINGS + ['JOB_FILES_G', 'GCS_G', 'LAUNCH']
   C4D_RENDERERS = [zync_c4d_constants.RendererNames.STANDARD,
                    zync_c4d_constants.RendererNames.PHYSICAL]
   SUPPORTED_RENDERERS = C4D_RENDERERS + [
@@ -54,9 +79,14 @@ class JobPresenter(Presenter):
       zync_c4d_constants.RendererNames.REDSHIFT,
       zync_c4d_constants.RendererNames.VRAY
   ]
+  # seconds for which the cached project list is reused
+  PROJECT_LIST_TTL = 60
 
   def __init__(self, dialog, main_presenter, zync_connection, zync_cache,
-      scene_settings, c4d_facade, thread_pool, main_thread_executor):
+      scene_settings, c4d_facade, thread_pool, thread_synchronization_factory,
+      main_thread_executor):
+    zync_threading.AsyncCaller.__init__(self, thread_pool,
+                                        thread_synchronization_factory)
     self._dialog = dialog
     self._main_presenter = main_presenter
     self._zync_connection = zync_connection
@@ -66,23 +96,60 @@ class JobPresenter(Presenter):
     self._thread_pool = thread_pool
     self._main_thread_executor = main_thread_executor
     self._available_instance_types = []
+    self._instance_type_index_by_name = {}
     self._project_list = []
     self._project_names = []
+    self._project_names_set = frozenset()
     self._all_take_settings = []
-    self._file_boxes = []
+    self._file_paths = []
+    self._file_checked = []
+    self._file_is_dir = []
+    self._changed_file_box_indices = set()
     self._selected_take_settings = None
     self._render_settings = None
+    self._renderer_name = None
+    self._scene_path = None
+    self._scene_stem = None
+    self._frames_from = None
+    self._frames_to = None
+    self._default_output_paths = {}
+    self._reload_pending = False
+    self._active = False
+    self._command_handlers = {
+        SYMBOLS['LOGOUT']: self._on_logout_clicked,
+        SYMBOLS['COST_CALC_LINK']: self._on_calculate_cost_clicked,
+        SYMBOLS['VMS_NUM']: self._on_instance_count_changed,
+        SYMBOLS['VMS_TYPE']: self._on_instance_type_changed,
+        SYMBOLS['FILES_LIST']: self._on_select_extra_files_clicked,
+        SYMBOLS['ADD_FILE']: self._on_add_file_clicked,
+        SYMBOLS['ADD_DIR']: self._on_add_directory_clicked,
+        SYMBOLS['OK_FILES']: self._on_select_extra_files_closed,
+        SYMBOLS['OUTPUT_PATH_BTN']: self._on_enter_output_path_clicked,
+        SYMBOLS['MULTIPASS_OUTPUT_PATH_BTN']: self._on_enter_multipass_output_path_clicked,
+        SYMBOLS['FRAMES_FROM']: self._on_start_frame_changed,
+        SYMBOLS['FRAMES_TO']: self._on_end_frame_changed,
+        SYMBOLS['EXISTING_PROJ_NAME']: self._on_existing_project_name_selected,
+        SYMBOLS['NEW_PROJ_NAME']: self._on_new_project_name_selected,
+        SYMBOLS['UPLOAD_ONLY']: self._on_upload_only_changed,
+        SYMBOLS['TAKE']: self._on_take_changed,
+        SYMBOLS['LAUNCH']: self._maybe_launch_job,
+    }
 
   def activate(self):
     """ Activates the job view. """
+    self._active = True
     self._dialog.load_layout('ZYNC_DIALOG')
     self._initialize_controls()
 
   def deactivate(self):
-    """ Does nothing """
-    pass
+    """ Deactivates the presenter. """
+    self._active = False
 
   def _initialize_controls(self):
+    self._scene_path = self._scene_settings.get_scene_path()
+    self._scene_stem = os.path.splitext(self._scene_settings.get_scene_name())[0]
+    self._default_output_paths = {}
+
     with self._dialog.change_menu():
       self._dialog.add_menu_entry('Logged in as %s' % self._zync_cache['email'])
       self._dialog.add_menu_entry('Log out', 'LOGOUT', 'Log out from Zync')
@@ -93,13 +160,12 @@ class JobPresenter(Presenter):
     self._dialog.set_int32('VMS_NUM', 1, min_value=1)
 
     # Storage settings (zync project)
-    self._project_list = self._zync_connection.get_project_list()
-    self._project_names = [project['name'] for project in self._project_list]
-    project_name_hint = re.sub(r'\.c4d$', '',
-                               self._scene_settings.get_scene_name())
+    self._project_list, self._project_names = self._get_project_list_cached()
+    self._project_names_set = frozenset(self._project_names)
+    project_name_hint = self._scene_stem
     self._dialog.set_combobox_content('EXISTING_PROJ_NAME', self._project_names)
     self._dialog.set_string('NEW_PROJ_NAME', project_name_hint)
-    if project_name_hint in self._project_names:
+    if project_name_hint in self._project_names_set:
       self._enable_existing_project_widget()
       self._dialog.set_combobox_index('EXISTING_PROJ_NAME',
                                       + self._project_names.index(
@@ -119,30 +185,47 @@ class JobPresenter(Presenter):
     # File management
     self._dialog.set_bool('UPLOAD_ONLY', False)
 
-    self._file_boxes = []
+    self._file_paths = []
+    self._file_checked = []
+    self._file_is_dir = []
     self._update_file_checkboxes()
 
     # Take
     self._selected_take_settings = None
     self._recreate_take_list()
 
+    # The view may be rebuilt while a previous submission is still uploading.
+    if self._is_c4d_job_in_flight():
+      self._set_settings_locked(True)
+
+  def _get_project_list_cached(self, ttl=PROJECT_LIST_TTL):
+    project_list_ts = self._zync_cache.get('project_list_ts')
+    if project_list_ts is None or time.time() - project_list_ts >= ttl:
+      project_list = self._zync_connection.get_project_list()
+      self._zync_cache['project_list'] = project_list
+      self._zync_cache['project_names'] = [project['name'] for project in project_list]
+      self._zync_cache['project_list_ts'] = time.time()
+    return self._zync_cache['project_list'], self._zync_cache['project_names']
+
+  def _invalidate_project_list(self):
+    # Submitting a job may create a new project.
+    self._zync_cache.pop('project_list_ts', None)
+
   def _default_output_path(self, suffix=''):
-    return os.path.abspath(
-        os.path.join(self._scene_settings.get_scene_path(), 'renders', '$take',
-                     self._scene_settings.get_scene_name_without_extension() + suffix))
+    if suffix not in self._default_output_paths:
+      self._default_output_paths[suffix] = os.path.abspath(
+          os.path.join(self._scene_path, 'renders', '$take',
+                       self._scene_stem + suffix))
+    return self._default_output_paths[suffix]
 
   def _update_file_checkboxes(self):
-    with self._dialog.change_layout('FILES_LIST_GROUP'):
-      for index, (path, checked, is_dir) in enumerate(self._file_boxes):
-        self._dialog.add_checkbox_to_group('FILES_LIST_OPTIONS', path, index)
-        self._dialog.set_group_bool('FILES_LIST_OPTIONS', checked, index)
-        if is_dir:
-          self._dialog.add_button_to_group('FILES_LIST_UNFOLD_BTNS', 'Unfold',
-                                           index)
-        else:
-          self._dialog.add_filler()
-    dirs_count = sum(int(is_dir) for (_, _, is_dir) in self._file_boxes)
-    files_count = len(self._file_boxes) - dirs_count
+    self._dialog.fill_checkbox_group('FILES_LIST_GROUP', 'FILES_LIST_OPTIONS',
+                                     'FILES_LIST_UNFOLD_BTNS', 'Unfold',
+                                     zip(self._file_paths, self._file_checked,
+                                         self._file_is_dir))
+    self._changed_file_box_indices.clear()
+    dirs_count = sum(self._file_is_dir)
+    files_count = len(self._file_is_dir) - dirs_count
     self._dialog.set_string('AUX_FILES_SUMMARY',
                             '%d files, %d folders' % (files_count, dirs_count))
 
@@ -154,11 +237,13 @@ class JobPresenter(Presenter):
 
     # set_combobox_content selected first entry, but we want to keep
     # previous selection if that take still exists:
-    for i, take_settings in enumerate(self._all_take_settings):
-      if take_settings == self._selected_take_settings:
-        # Previously selected take found, select it again
-        self._dialog.set_combobox_index('TAKE', i)
-        return
+    take_index_by_settings = {take_settings: i for i, take_settings in
+                              enumerate(self._all_take_settings)}
+    take_index = take_index_by_settings.get(self._selected_take_settings)
+    if take_index is not None:
+      # Previously selected take found, select it again
+      self._dialog.set_combobox_index('TAKE', take_index)
+      return
 
     # Previously selected take not found, just switch to first one
     self._handle_take_change()
@@ -173,6 +258,7 @@ class JobPresenter(Presenter):
       return
     self._selected_take_settings = take_settings
     self._render_settings = self._selected_take_settings.get_render_settings()
+    self._renderer_name = self._render_settings.get_renderer_name()
     previous_instance_type = self._get_previous_instance_type()
     self._update_renderer_and_available_instance_types()
     self._update_available_instance_types()
@@ -192,7 +278,7 @@ class JobPresenter(Presenter):
     return previous_instance_type
 
   def _update_renderer_and_available_instance_types(self):
-    renderer_name = self._render_settings.get_renderer_name()
+    renderer_name = self._renderer_name
     if renderer_name in self.SUPPORTED_RENDERERS:
       self._dialog.set_string('RENDERER', renderer_name)
       external_renderer = renderer_name
@@ -204,13 +290,16 @@ class JobPresenter(Presenter):
     else:
       self._dialog.set_string('RENDERER', renderer_name + ' (unsupported)')
       self._available_instance_types = []
-    if renderer_name == zync_c4d_constants.RendererNames.VRAY:
+    if renderer_name == _VRAY:
       self._dialog.set_int32('CHUNK', 1)
       self._dialog.enable_widget('CHUNK', False)
     else:
       self._dialog.enable_widget('CHUNK', True)
 
   def _update_available_instance_types(self):
+    self._instance_type_index_by_name = {
+        instance_type['name']: i for i, instance_type in enumerate(self._available_instance_types)
+    }
     if self._available_instance_types:
       instance_type_labels = [instance_type['label'] for instance_type in
                               self._available_instance_types]
@@ -219,10 +308,9 @@ class JobPresenter(Presenter):
     self._dialog.set_combobox_content('VMS_TYPE', instance_type_labels)
 
   def _maybe_restore_previous_instance_type(self, previous_instance_type):
-    for i, instance_type in enumerate(self._available_instance_types):
-      if instance_type['name'] == previous_instance_type['name']:
-        self._dialog.set_combobox_index('VMS_TYPE', i)
-        return
+    index = self._instance_type_index_by_name.get(previous_instance_type['name'])
+    if index is not None:
+      self._dialog.set_combobox_index('VMS_TYPE', index)
 
   def _update_price(self):
     if self._available_instance_types:
@@ -244,17 +332,19 @@ class JobPresenter(Presenter):
   def _update_frame_range_controls(self):
     start_frame, end_frame, frame_step = self._render_settings.get_frame_range(
         self._scene_settings.get_fps())
+    self._frames_from = start_frame
+    self._frames_to = end_frame
     self._dialog.set_int32('FRAMES_FROM', start_frame, max_value=end_frame)
     self._dialog.set_int32('FRAMES_TO', end_frame, min_value=start_frame)
     self._dialog.set_int32('STEP', frame_step, min_value=1)
 
-  def _update_output_path_controls(self, ):
-    self._dialog.enable_widget('OUTPUT_PATH', self._is_image_saving_enabled())
-    self._dialog.enable_widget('OUTPUT_PATH_BTN',
-                               self._is_image_saving_enabled())
-    if self._is_image_saving_enabled():
+  def _update_output_path_controls(self):
+    image_saving_enabled = self._is_image_saving_enabled()
+    self._dialog.enable_widget('OUTPUT_PATH', image_saving_enabled)
+    self._dialog.enable_widget('OUTPUT_PATH_BTN', image_saving_enabled)
+    if image_saving_enabled:
       if self._render_settings.has_image_path():
-        output_path = os.path.join(self._scene_settings.get_scene_path(),
+        output_path = os.path.join(self._scene_path,
                                    self._render_settings.get_image_path())
         self._dialog.set_string('OUTPUT_PATH', output_path)
       else:
@@ -263,14 +353,13 @@ class JobPresenter(Presenter):
       self._dialog.set_string('OUTPUT_PATH', 'Not enabled')
 
   def _update_multipass_output_path_controls(self):
-    self._dialog.enable_widget('MULTIPASS_OUTPUT_PATH',
-                               self._is_multipass_image_saving_enabled())
-    self._dialog.enable_widget('MULTIPASS_OUTPUT_PATH_BTN',
-                               self._is_multipass_image_saving_enabled())
-    if self._is_multipass_image_saving_enabled():
+    multipass_image_saving_enabled = self._is_multipass_image_saving_enabled()
+    self._dialog.enable_widget('MULTIPASS_OUTPUT_PATH', multipass_image_saving_enabled)
+    self._dialog.enable_widget('MULTIPASS_OUTPUT_PATH_BTN', multipass_image_saving_enabled)
+    if multipass_image_saving_enabled:
       if self._render_settings.has_multipass_image_path():
         output_path = os.path.abspath(
-          os.path.join(self._scene_settings.get_scene_path(),
+          os.path.join(self._scene_path,
                        self._render_settings.get_multipass_image_path()))
         self._dialog.set_string('MULTIPASS_OUTPUT_PATH', output_path)
       else:
@@ -289,6 +378,10 @@ class JobPresenter(Presenter):
 
   def on_scene_changed(self):
     """ Called when C4D scene is changed to a different scene. """
+    if self._is_c4d_job_in_flight():
+      # The settings are locked until the submission finishes, which reloads the view.
+      self._reload_pending = True
+      return
     self._main_presenter.reload_job_view()
 
   def on_command(self, command_id):
@@ -297,44 +390,16 @@ class JobPresenter(Presenter):
 
     :param int command_id: Id of the widget.
     """
-    if command_id == SYMBOLS['LOGOUT']:
-      self._on_logout_clicked()
-    elif command_id == SYMBOLS['COST_CALC_LINK']:
-      self._on_calculate_cost_clicked()
-    elif command_id == SYMBOLS['VMS_NUM']:
-      self._on_instance_count_changed()
-    elif command_id == SYMBOLS['VMS_TYPE']:
-      self._on_instance_type_changed()
-    elif command_id == SYMBOLS['FILES_LIST']:
-      self._on_select_extra_files_clicked()
-    elif command_id == SYMBOLS['ADD_FILE']:
-      self._on_add_file_clicked()
-    elif command_id == SYMBOLS['ADD_DIR']:
-      self._on_add_directory_clicked()
-    elif command_id == SYMBOLS['OK_FILES']:
-      self._on_select_extra_files_closed()
-    elif command_id == SYMBOLS['OUTPUT_PATH_BTN']:
-      self._on_enter_output_path_clicked()
-    elif command_id == SYMBOLS['MULTIPASS_OUTPUT_PATH_BTN']:
-      self._on_enter_multipass_output_path_clicked()
-    elif command_id == SYMBOLS['FRAMES_FROM']:
-      self._on_start_frame_changed()
-    elif command_id == SYMBOLS['FRAMES_TO']:
-      self._on_end_frame_changed()
-    elif command_id == SYMBOLS['EXISTING_PROJ_NAME']:
-      self._on_existing_project_name_selected()
-    elif command_id == SYMBOLS['NEW_PROJ_NAME']:
-      self._on_new_project_name_selected()
-    elif command_id == SYMBOLS['UPLOAD_ONLY']:
-      self._on_upload_only_changed()
-    elif command_id == SYMBOLS['TAKE']:
-      self._on_take_changed()
+    handler = self._command_handlers.get(command_id)
+    if handler:
+      handler()
+    elif SYMBOLS['FILES_LIST_OPTIONS'] <= command_id < SYMBOLS[
+      'FILES_LIST_OPTIONS'] + 10000:
+      self._on_file_checkbox_changed(command_id - SYMBOLS['FILES_LIST_OPTIONS'])
     elif SYMBOLS['FILES_LIST_UNFOLD_BTNS'] <= command_id < SYMBOLS[
       'FILES_LIST_UNFOLD_BTNS'] + 10000:
       self._on_unfold_directory_clicked(
           command_id - SYMBOLS['FILES_LIST_UNFOLD_BTNS'])
-    elif command_id == SYMBOLS['LAUNCH']:
-      self._maybe_launch_job()
 
   def _on_logout_clicked(self):
     """
@@ -342,6 +407,10 @@ class JobPresenter(Presenter):
 
     Switches back to login view.
     """
+    if self._is_c4d_job_in_flight():
+      self._c4d_facade.show_message_box(
+          'Job upload is in progress.\n\nPlease wait until it finishes before logging out.')
+      return
     self._main_presenter.log_out()
 
   @staticmethod
@@ -359,7 +428,6 @@ class JobPresenter(Presenter):
 
   def _on_select_extra_files_clicked(self):
     """ Called when user clicks 'select extra files' button. """
-    self._update_file_checkboxes()
     self._dialog.switch_tab('FILES_TAB')
 
   def _on_select_extra_files_closed(self):
@@ -379,14 +447,24 @@ class JobPresenter(Presenter):
     self._read_file_checkboxes()
     path = self._c4d_facade.show_load_dialog(directory)
     if path is not None:
-      self._file_boxes.append((path, True, directory))
+      self._file_paths.append(path)
+      self._file_checked.append(True)
+      self._file_is_dir.append(directory)
       self._update_file_checkboxes()
 
+  def _on_file_checkbox_changed(self, index):
+    """
+    Called when user toggles a checkbox in the files list.
+
+    :param int index: Index of the checkbox, in the order as it appears in the GUI.
+    """
+    self._changed_file_box_indices.add(index)
+
   def _read_file_checkboxes(self):
-    self._file_boxes = [
-        (path, self._dialog.get_group_bool('FILES_LIST_OPTIONS', index), is_dir)
-        for index, (path, _, is_dir) in enumerate(self._file_boxes)
-    ]
+    # Only checkboxes toggled since the list was last built can differ from _file_checked.
+    for index in self._changed_file_box_indices:
+      self._file_checked[index] = self._dialog.get_group_bool('FILES_LIST_OPTIONS', index)
+    self._changed_file_box_indices.clear()
 
   def _on_enter_output_path_clicked(self):
     """ Called when user clicks 'enter output path' button. """
@@ -406,17 +484,23 @@ class JobPresenter(Presenter):
 
   def _on_start_frame_changed(self):
     """ Called when user changes 'start frame' field. """
-    self._dialog.set_int32(
-        'FRAMES_TO',
-        self._dialog.get_int32('FRAMES_TO'),
-        min_value=self._dialog.get_int32('FRAMES_FROM'))
+    self._frames_from = self._dialog.get_int32('FRAMES_FROM')
+    if self._frames_to is None:
+      # Frame range controls were never filled, e.g. when the take is invalid.
+      self._frames_to = self._dialog.get_int32('FRAMES_TO')
+    self._frames_to = max(self._frames_to, self._frames_from)
+    self._dialog.set_int32('FRAMES_TO', self._frames_to,
+                           min_value=self._frames_from)
 
   def _on_end_frame_changed(self):
     """ Called when user changes 'end frame' field. """
-    self._dialog.set_int32(
-        'FRAMES_FROM',
-        self._dialog.get_int32('FRAMES_FROM'),
-        max_value=self._dialog.get_int32('FRAMES_TO'))
+    self._frames_to = self._dialog.get_int32('FRAMES_TO')
+    if self._frames_from is None:
+      # Frame range controls were never filled, e.g. when the take is invalid.
+      self._frames_from = self._dialog.get_int32('FRAMES_FROM')
+    self._frames_from = min(self._frames_from, self._frames_to)
+    self._dialog.set_int32('FRAMES_FROM', self._frames_from,
+                           max_value=self._frames_to)
 
   def _on_existing_project_name_selected(self):
     """ Called when user selects 'existing project name' radio. """
@@ -453,23 +537,28 @@ class JobPresenter(Presenter):
     """
     self._read_file_checkboxes()
 
-    def _generate_new_fboxes(file_boxes):
-      for i in xrange(dir_index):
-        yield file_boxes[i]
-
-      dir_path, _checked, _is_dir = file_boxes[dir_index]
-      for file_name in os.listdir(dir_path):
-        file_path = os.path.join(dir_path, file_name)
-        if os.path.isfile(file_path):
-          yield (file_path, True, False)
-        elif os.path.isdir(file_path):
-          yield (file_path, True, True)
-
-      for i in xrange(dir_index + 1, len(file_boxes)):
-        yield file_boxes[i]
-
-    new_file_boxes = list(_generate_new_fboxes(self._file_boxes))
-    self._file_boxes = new_file_boxes
+    dir_path = self._file_paths[dir_index]
+    new_paths = []
+    new_is_dir = []
+    for file_name in os.listdir(dir_path):
+      file_path = os.path.join(dir_path, file_name)
+      # A single stat call answers both "is file" and "is directory".
+      try:
+        file_mode = os.stat(file_path).st_mode
+      except OSError:
+        continue
+      if stat.S_ISREG(file_mode):
+        new_paths.append(file_path)
+        new_is_dir.append(False)
+      elif stat.S_ISDIR(file_mode):
+        new_paths.append(file_path)
+        new_is_dir.append(True)
+
+    # Replace the directory with its entries, all of them checked.
+    unfolded = slice(dir_index, dir_index + 1)
+    self._file_paths[unfolded] = new_paths
+    self._file_checked[unfolded] = [True] * len(new_paths)
+    self._file_is_dir[unfolded] = new_is_dir
     self._update_file_checkboxes()
 
   def _maybe_launch_job(self):
@@ -499,7 +588,7 @@ class JobPresenter(Presenter):
 
   def _launch_job(self, params):
     try:
-      if self._render_settings.get_renderer_name() == zync_c4d_constants.RendererNames.VRAY:
+      if self._renderer_name == _VRAY:
         self._start_vray_job_submission(params)
       else:
         self._submit_c4d_job(params)
@@ -507,11 +596,15 @@ class JobPresenter(Presenter):
       self._c4d_facade.show_message_box(err.message)
 
   def _run_preflights(self, params):
+    # Preflights are experimental, so they are imported only when enabled.
+    zync_preflights = import_zync_module('zync_preflights')
+    common_preflights = import_zync_module('zync_preflights.common_checks')
+
     def _on_status_change(preflight_check, status):
-      print 'Preflight Check Status Change ', preflight_check.preflight_name, ' ---> ', status
+      print('Preflight Check Status Change ', preflight_check.preflight_name, ' ---> ', status)
 
     def _on_result(result):
-      print 'Preflight Check Result ', result
+      print('Preflight Check Result ', result)
 
     preflights = [
         common_preflights.DependencyCheck(params['scene_info']['dependencies'],
@@ -529,21 +622,54 @@ class JobPresenter(Presenter):
         'Don\'t turn off the client app before upload is complete.')
 
   def _submit_c4d_job(self, params):
-    # TODO: Make it async, also: async calls should disable UI
-    try:
-      doc_dirpath = self._scene_settings.get_scene_path()
-      doc_name = self._scene_settings.get_scene_name()
-      doc_path = os.path.join(doc_dirpath, doc_name)
-      self._zync_connection.submit_job('c4d', doc_path, params)
-      self._show_job_successfuly_submitted_dialog()
-    except (zync.ZyncPreflightError, zync.ZyncError) as err:
-      self._c4d_facade.show_message_box('{0}:\n\n{1}', err.__class__.__name__, zync_c4d_utils.to_unicode(err))
-    except:
+    doc_dirpath = self._scene_settings.get_scene_path()
+    doc_name = self._scene_settings.get_scene_name()
+    doc_path = os.path.join(doc_dirpath, doc_name)
+    # Prevents submitting the same job twice while the upload is in progress.
+    # The flag lives in the cache, so it survives reloading the job view.
+    self._zync_cache['c4d_job_in_flight'] = True
+    self._set_settings_locked(True)
+    self._send_c4d_job(doc_path, params)
+
+  def _is_c4d_job_in_flight(self):
+    return self._zync_cache.get('c4d_job_in_flight', False)
+
+  def _on_c4d_job_submitted(self, _result):
+    self._invalidate_project_list()
+    self._show_job_successfuly_submitted_dialog()
+    self._finish_c4d_job_submission()
+
+  def _on_c4d_job_submission_error(self, exception, traceback_str):
+    if isinstance(exception, (zync.ZyncPreflightError, zync.ZyncError)):
+      self._c4d_facade.show_message_box('{0}:\n\n{1}', exception.__class__.__name__,
+                                        zync_c4d_utils.to_unicode(exception))
+    else:
       self._c4d_facade.show_message_box('Unexpected error during job submission')
-      zync_c4d_utils.post_plugin_error(traceback.format_exc())
+      zync_c4d_utils.post_plugin_error(traceback_str)
+    self._finish_c4d_job_submission()
+
+  def _finish_c4d_job_submission(self):
+    self._zync_cache['c4d_job_in_flight'] = False
+    if self._reload_pending or not self._active:
+      # The scene changed or the view was rebuilt during the upload, so the
+      # current view still shows locked settings.
+      self._reload_pending = False
+      self._main_presenter.reload_job_view()
+    else:
+      self._set_settings_locked(False)
+
+  def _set_settings_locked(self, locked):
+    for item_name in self.SUBMISSION_LOCKED_SETTINGS:
+      self._dialog.enable_widget(item_name, not locked)
+    if not locked:
+      self._on_upload_only_changed()
+
+  @async_call(_on_c4d_job_submitted, _on_c4d_job_submission_error)
+  def _send_c4d_job(self, doc_path, params):
+    self._zync_connection.submit_job('c4d', doc_path, params)
 
   def _start_vray_job_submission(self, params):
-    print 'Vray job, collecting additional info...'
+    print('Vray job, collecting additional info...')
 
     if self._is_image_saving_enabled() and self._is_multipass_image_saving_enabled():
       if not self._render_settings.is_multipass_image_format_same_as_regular():
@@ -569,7 +695,7 @@ class JobPresenter(Presenter):
     else:
       output_path = self._dialog.get_string('OUTPUT_PATH')
     output_path = self._render_settings.convert_tokens(output_path)
-    print 'output_path: %s' % output_path
+    print('output_path: %s' % output_path)
     params['output_dir'], params['output_name'] = self._split_output_path(
         output_path)
     params['scene_info'][
@@ -580,6 +706,7 @@ class JobPresenter(Presenter):
     if not os.path.exists(path):
       os.makedirs(path)
     vrscene_path = os.path.join(path, os.path.splitext(doc_name)[0])
+    from zync_c4d_vray_exporter import VRayExporter
     vrscene_exporter = VRayExporter(self._main_thread_executor, vrscene_path,
                                     params,
                                     self._scene_settings, self._render_settings,
@@ -589,24 +716,18 @@ class JobPresenter(Presenter):
 
   def _send_vray_scene(self, vrscene_path, params):
     try:
-      copy_keys = [
-          'renderer', 'plugin_version', 'num_instances', 'instance_type',
-          'proj_name', 'job_subtype', 'priority', 'notify_complete',
-          'upload_only', 'xres', 'yres', 'chunk_size', 'scene_info',
-          'take', 'output_dir', 'output_name',
-          'format', 'frame_begin', 'frame_end', 'step'
-      ]
-      render_params = {key: params[key] for key in copy_keys}
+      render_params = dict(zip(_VRAY_COPY_KEYS, _VRAY_COPY_GET(params)))
 
       try:
         vray_version = self._render_settings.get_vray_settings().get_version_from_vrscene(
             vrscene_path)
       except C4dVrayVersionException as err:
         raise zync.ZyncError(err.message)
-      print 'Detected vray version: %s' % vray_version
+      print('Detected vray version: %s' % vray_version)
       render_params['scene_info']['vray_version'] = vray_version
       vrscene = vrscene_path + '*.vrscene'
       self._zync_connection.submit_job('c4d_vray', vrscene, params=render_params)
+      self._invalidate_project_list()
       self._show_job_successfuly_submitted_dialog()
     except (zync.ZyncPreflightError, zync.ZyncError) as err:
       self._c4d_facade.show_message_box('{0}:\n\n{1}', err.__class__.__name__, zync_c4d_utils.to_unicode(err))
@@ -635,10 +756,15 @@ class JobPresenter(Presenter):
     return True
 
   def _split_output_path(self, out_path):
-    out_dir, out_name = os.path.split(out_path)
-    while '$' in out_dir:
-      out_dir, dir1 = os.path.split(out_dir)
-      out_name = os.path.join(dir1, out_name)
+    drive, path = os.path.splitdrive(out_path)
+    token_index = path.find('$')
+    if token_index == -1:
+      out_dir, out_name = os.path.split(out_path)
+    else:
+      # Directories from the first token on belong to the output name.
+      sep_index = max(path.rfind(sep, 0, token_index) for sep in _PATH_SEPARATORS)
+      out_dir = os.path.dirname(drive + path[:sep_index + 1])
+      out_name = _SEPARATOR_RUN_RE.sub(lambda _match: os.sep, path[sep_index + 1:])
     if not os.path.isabs(out_dir):
       out_dir = os.path.join(self._scene_settings.get_scene_path(), out_dir)
     out_dir = os.path.abspath(out_dir)
@@ -648,7 +774,7 @@ class JobPresenter(Presenter):
     try:
       params = {}
 
-      renderer_name = self._render_settings.get_renderer_name()
+      renderer_name = self._renderer_name
       if renderer_name not in self.SUPPORTED_RENDERERS:
         raise ValidationError(
             'Renderer \'%s\' is not currently supported by Zync' % renderer_name)
@@ -670,14 +796,15 @@ class JobPresenter(Presenter):
       params['notify_complete'] = int(self._dialog.get_bool('NOTIFY_COMPLETE'))
       params['upload_only'] = int(self._dialog.get_bool('UPLOAD_ONLY'))
 
-      self._maybe_update_regular_image_params(params)
-      self._maybe_update_multipass_image_params(params)
-      if not self._is_output_enabled:
+      snapshot = self._render_settings.get_submit_snapshot()
+      self._maybe_update_regular_image_params(params, snapshot)
+      self._maybe_update_multipass_image_params(params, snapshot)
+      if not self._is_output_enabled(renderer_name, snapshot):
         raise ValidationError(
             'No output is enabled. Please either enable regular image ' +
             'or multi-pass image output from the render settings.')
 
-      out_fps = self._render_settings.get_frame_rate()
+      out_fps = snapshot['frame_rate']
       proj_fps = self._scene_settings.get_fps()
       if out_fps != proj_fps:
         raise ValidationError(
@@ -688,11 +815,12 @@ class JobPresenter(Presenter):
 
       params['frame_begin'] = self._dialog.get_int32('FRAMES_FROM')
       params['frame_end'] = self._dialog.get_int32('FRAMES_TO')
-      params['step'] = str(self._dialog.get_int32('STEP'))
-      params['chunk_size'] = str(self._dialog.get_int32('CHUNK'))
-      params['xres'] = str(self._dialog.get_int32('RES_X'))
-      params['yres'] = str(self._dialog.get_int32('RES_Y'))
-      user_files = [path for (path, checked, _) in self._file_boxes if checked]
+      params['step'] = '%d' % self._dialog.get_int32('STEP')
+      params['chunk_size'] = '%d' % self._dialog.get_int32('CHUNK')
+      params['xres'] = '%d' % self._dialog.get_int32('RES_X')
+      params['yres'] = '%d' % self._dialog.get_int32('RES_Y')
+      user_files = [path for path, checked in zip(self._file_paths, self._file_checked)
+                    if checked]
       asset_files, preset_files = self._get_assets_and_presets()
       params['scene_info'] = {
           'dependencies': list(asset_files) + list(preset_files) + user_files,
@@ -707,16 +835,19 @@ class JobPresenter(Presenter):
       return params
     except C4dRendererSettingsUnavailableException:
       raise ValidationError(
-          'Unable to get %s render settings' % self._render_settings.get_renderer_name())
+          'Unable to get %s render settings' % self._renderer_name)
 
-  @property
-  def _is_output_enabled(self):
-    return self._render_settings.get_renderer_name() == zync_c4d_constants.RendererNames.VRAY or \
-           self._is_image_saving_enabled() or self._is_multipass_image_saving_enabled()
+  @staticmethod
+  def _is_output_enabled(renderer_name, snapshot):
+    if renderer_name == _VRAY:
+      return True
+    if not snapshot['saving_globally_enabled']:
+      return False
+    return snapshot['image_saving_enabled'] or snapshot['multipass_image_saving_enabled']
 
-  def _maybe_update_multipass_image_params(self, params):
-    if self._is_multipass_image_saving_enabled() and self._render_settings.get_renderer_name() != \
-        zync_c4d_constants.RendererNames.VRAY:
+  def _maybe_update_multipass_image_params(self, params, snapshot):
+    if snapshot['saving_globally_enabled'] and snapshot['multipass_image_saving_enabled'] and \
+        self._renderer_name != _VRAY:
       out_path = self._dialog.get_string('MULTIPASS_OUTPUT_PATH')
       params['multipass_output_dir'], params[
         'multipass_output_name'] = self._split_output_path(
@@ -726,8 +857,8 @@ class JobPresenter(Presenter):
       except C4dRenderFormatUnsupportedException as err:
         raise ValidationError(err.message)
 
-  def _maybe_update_regular_image_params(self, params):
-    if self._is_image_saving_enabled():
+  def _maybe_update_regular_image_params(self, params, snapshot):
+    if snapshot['saving_globally_enabled'] and snapshot['image_saving_enabled']:
       out_path = self._dialog.get_string('OUTPUT_PATH')
       params['output_dir'], params['output_name'] = self._split_output_path(
           out_path)
@@ -737,14 +868,14 @@ class JobPresenter(Presenter):
         raise ValidationError(err.message)
 
   def _add_render_specific_params(self, params):
-    if self._render_settings.get_renderer_name() == zync_c4d_constants.RendererNames.ARNOLD:
+    if self._renderer_name == _ARNOLD:
       arnold_settings = self._render_settings.get_arnold_settings()
       params['scene_info']['c4dtoa_version'] = arnold_settings.get_version()
       if arnold_settings.is_skip_license_check_enabled():
         raise ValidationError(
             'Please disable "Skip license check" in your '
             'Arnold settings to avoid rendering with a watermark.')
-    elif self._render_settings.get_renderer_name() == zync_c4d_constants.RendererNames.REDSHIFT:
+    elif self._renderer_name == _REDSHIFT:
       params['scene_info'][
         'redshift_version'] = self._render_settings.get_redshift_settings().get_version()
 
@@ -756,33 +887,57 @@ class JobPresenter(Presenter):
           'Please fix scene dependencies before submitting the job.\n\n'
           'Try going to Textures tab in Project Info and using '
           'Mark Missing Textures button to find possible problems.')
-    asset_files = set()
-    preset_files = set()
-    preset_re = re.compile(r'preset://([^/]+)/')
-    for asset in assets:
-      match = preset_re.match(asset['filename'])
-      if match:
-        preset_pack = match.group(1)
-        # preset path candidates:
-        user_path = os.path.join(self._c4d_facade.get_user_library_path(),
-                                 'browser', preset_pack)
-        glob_path = os.path.join(self._c4d_facade.get_library_path(), 'browser',
-                                 preset_pack)
-        if os.path.exists(user_path):
-          preset_files.add(user_path)
-        elif os.path.exists(glob_path):
-          preset_files.add(glob_path)
-        else:
-          raise ValidationError(
-              'Unable to locate asset \'%s\'' % asset['filename'])
+    if not assets:
+      asset_files = set()
+      self._add_ocio_assets(asset_files)
+      return asset_files, set()
+    match_preset = _PRESET_RE.match
+    filenames = [asset['filename'] for asset in assets]
+    matches = [(filename, match_preset(filename)) for filename in filenames]
+    # Regular assets are collected in one pass, so the set is sized once.
+    asset_files = set(filename for filename, match in matches if match is None)
+    resolved_packs = {}
+    user_browser_entries = None
+    for filename, match in matches:
+      if match is None:
+        continue
+      preset_pack = match.group(1)
+      if preset_pack in resolved_packs:
+        continue
+      if user_browser_entries is None:
+        # Each browser directory is listed once instead of probing every preset pack.
+        user_browser_dir = os.path.join(self._c4d_facade.get_user_library_path(), 'browser')
+        glob_browser_dir = os.path.join(self._c4d_facade.get_library_path(), 'browser')
+        user_browser_entries = self._list_dir_entries(user_browser_dir)
+        glob_browser_entries = self._list_dir_entries(glob_browser_dir)
+      # preset path candidates:
+      user_preset_path = os.path.join(user_browser_dir, preset_pack)
+      glob_preset_path = os.path.join(glob_browser_dir, preset_pack)
+      # A listing hit is the fast path; names differing only in case (e.g. on a
+      # case-insensitive filesystem) still need a real lookup.
+      pack_key = os.path.normcase(preset_pack)
+      if pack_key in user_browser_entries or os.path.exists(user_preset_path):
+        resolved_packs[preset_pack] = user_preset_path
+      elif pack_key in glob_browser_entries or os.path.exists(glob_preset_path):
+        resolved_packs[preset_pack] = glob_preset_path
       else:
-        asset_files.add(asset['filename'])
+        raise ValidationError('Unable to locate asset \'%s\'' % filename)
+    preset_files = set(resolved_packs.values())
     self._add_ocio_assets(asset_files)
     return asset_files, preset_files
 
+  @staticmethod
+  def _list_dir_entries(path):
+    try:
+      return set(os.path.normcase(name) for name in os.listdir(path))
+    except OSError:
+      return set()
+
   def _add_ocio_assets(self, asset_files):
-    if self._render_settings.get_renderer_name() == zync_c4d_constants.RendererNames.REDSHIFT:
-      for ocio_config_path in self._render_settings.get_redshift_settings().get_ocio_config_paths():
+    if self._renderer_name == _REDSHIFT:
+      ocio_config_paths = self._render_settings.get_redshift_settings().get_ocio_config_paths()
+      # Several video posts commonly share one config, parse each config only once.
+      for ocio_config_path in set(ocio_config_paths):
         asset_files.update(zync.get_ocio_files(ocio_config_path))
 
   def _read_project_name(self):
@@ -790,17 +945,17 @@ class JobPresenter(Presenter):
       proj_name = self._dialog.get_string('NEW_PROJ_NAME')
       proj_name = proj_name.strip()
       try:
-        proj_name = str(proj_name)
-      except ValueError:
+        proj_name.encode('ascii')
+      except UnicodeError:
         raise ValidationError(
             'Project name \'%s\' contains illegal characters.' % proj_name)
-      if re.search(r'[/\\]', proj_name):
+      if '/' in proj_name or '\\' in proj_name:
         raise ValidationError(
             'Project name \'%s\' contains illegal characters.' % proj_name)
       if proj_name == '':
         raise ValidationError(
             'You must choose existing project or give valid name for a new one.')
-      if proj_name in self._project_names:
+      if proj_name in self._project_names_set:
         raise ValidationError(
             'Project named \'%s\' already exists.' % proj_name)
       return proj_name
@@ -11,6 +11,8 @@ class LoginPresenter(Presenter):
   :param zync_c4d_main_presenter.MainPresenter main_presenter:
   """
 
+  __slots__ = ('_dialog', '_main_presenter')
+
   def __init__(self, dialog, main_presenter):
     self._dialog = dialog
     self._main_presenter = main_presenter
@@ -11,6 +11,9 @@ class MainPresenter(Presenter):
   :param zync_c4d_presenter_factory.PresenterFactory presenter_factory:
   """
 
+  __slots__ = ('_c4d_facade', '_auto_login', '_logged_in', '_zync_connection', '_zync_cache',
+               '_presenter_factory', '_active_presenter')
+
   def __init__(self, c4d_facade, presenter_factory):
     self._c4d_facade = c4d_facade
     self._auto_login = True
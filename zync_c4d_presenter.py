@@ -7,6 +7,7 @@ class Presenter(object):
   """ Interface for presenters. """
 
   __metaclass__ = ABCMeta
+  __slots__ = ()
 
   @abstractmethod
   def activate(self):
@@ -53,7 +53,8 @@ class PresenterFactory(object):
     """
     return JobPresenter(self._dialog, main_presenter, zync_connection,
                         zync_cache, scene_settings, self._c4d_facade,
-                        self._thread_pool, self._main_thread_executor)
+                        self._thread_pool, self._thread_pool,
+                        self._main_thread_executor)
 
   def create_main_presenter(self):
     """
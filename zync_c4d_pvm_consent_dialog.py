@@ -3,13 +3,11 @@ from importlib import import_module
 import webbrowser
 
 from zync_c4d_constants import SYMBOLS
-from zync_c4d_utils import init_c4d_resources, show_exceptions
+from zync_c4d_utils import import_zync_module, init_c4d_resources, show_exceptions
 
 c4d = import_module('c4d')
 __res__ = init_c4d_resources()
 
-from zync_c4d_utils import import_zync_module
-
 
 class PvmConsentDialog(c4d.gui.GeDialog):
   """
@@ -21,21 +21,22 @@ class C4dRedshiftSettings(zync_threading.MainThreadCaller):
     zync_threading.MainThreadCaller.__init__(self, main_thread_executor)
     self._video_posts = video_posts
 
-  @main_thread
   def get_ocio_config_paths(self):
     """
     Returns OCIO paths.
 
     :return list[str]:
     """
-    ocio_config_paths = []
     # This feature is not available with all RedShift versions
-    if hasattr(c4d, 'REDSHIFT_POSTEFFECTS_COLORMANAGEMENT_OCIO_FILE'):
-      for video_post in self._video_posts:
-        ocio_config_path = video_post[c4d.REDSHIFT_POSTEFFECTS_COLORMANAGEMENT_OCIO_FILE]
-        if ocio_config_path:
-          ocio_config_paths.append(ocio_config_path)
-    return ocio_config_paths
+    ocio_file_key = getattr(c4d, 'REDSHIFT_POSTEFFECTS_COLORMANAGEMENT_OCIO_FILE', None)
+    if ocio_file_key is None:
+      return []
+    return self._read_ocio_config_paths(ocio_file_key)
+
+  @main_thread
+  def _read_ocio_config_paths(self, ocio_file_key):
+    ocio_config_paths = (video_post[ocio_file_key] for video_post in self._video_posts)
+    return [ocio_config_path for ocio_config_path in ocio_config_paths if ocio_config_path]
 
   @main_thread
   def get_version(self):
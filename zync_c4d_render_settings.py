@@ -55,6 +55,8 @@ class C4dRenderSettings(zync_threading.MainThreadCaller):
     self._render_data = render_data
     self._document = document
     self._take = take
+    self._saving_globally_enabled = None
+    self._typed_video_posts = None
 
   renderer_name_map = {
     c4d.RDATA_RENDERENGINE_STANDARD: zync_c4d_constants.RendererNames.STANDARD,
@@ -81,6 +83,7 @@ class C4dRenderSettings(zync_threading.MainThreadCaller):
     c4d.FILTER_TGA: 'TGA',
     c4d.FILTER_TIF: 'TIFF'
   }
+  _supported_formats_str = ', '.join(supported_formats.values())
 
   @main_thread
   def convert_tokens(self, path):
@@ -109,26 +112,35 @@ class C4dRenderSettings(zync_threading.MainThreadCaller):
     video_posts = self._get_video_posts([zync_c4d_constants.ARNOLD_RENDERER])
     return C4dArnoldSettings(self._main_thread_executor, video_posts[0], self._document)
 
-  @main_thread
   def _get_video_posts(self, video_post_types):
     """
     Generates render settings of specified types.
 
+    Video posts are listed once and reused for the lifetime of this object.
+
     :param collections.Iterable[int] video_post_types: collection of video post types.
     :return list[c4d.documents.BaseVideoPost]:
     :raises:
       C4dRendererSettingsUnavailableException: If no matching video post is found.
     """
-    video_posts = []
-    video_post = self._render_data.GetFirstVideoPost()
-    while video_post:
-      if video_post.GetType() in video_post_types:
-        video_posts.append(video_post)
-      video_post = video_post.GetNext()
+    if self._typed_video_posts is None:
+      self._typed_video_posts = self._read_typed_video_posts()
+    video_post_types = frozenset(video_post_types)
+    video_posts = [video_post for video_post_type, video_post in self._typed_video_posts
+                   if video_post_type in video_post_types]
     if not video_posts:
       raise C4dRendererSettingsUnavailableException()
     return video_posts
 
+  @main_thread
+  def _read_typed_video_posts(self):
+    typed_video_posts = []
+    video_post = self._render_data.GetFirstVideoPost()
+    while video_post:
+      typed_video_posts.append((video_post.GetType(), video_post))
+      video_post = video_post.GetNext()
+    return typed_video_posts
+
   @main_thread
   def get_frame_range(self, fps):
     """
@@ -142,15 +154,6 @@ class C4dRenderSettings(zync_threading.MainThreadCaller):
     frame_step = self._render_data[c4d.RDATA_FRAMESTEP]
     return start_frame, end_frame, frame_step
 
-  @main_thread
-  def get_frame_rate(self):
-    """
-    Returns the frame rate.
-
-    :return int:
-    """
-    return self._render_data[c4d.RDATA_FRAMERATE]
-
   @main_thread
   def get_image_format(self):
     """
@@ -166,7 +169,7 @@ class C4dRenderSettings(zync_threading.MainThreadCaller):
     else:
       raise C4dRenderFormatUnsupportedException(
         'Regular image output format not supported. Supported formats: ' +
-        ', '.join(self.supported_formats.values()))
+        self._supported_formats_str)
 
   @main_thread
   def get_image_path(self):
@@ -192,7 +195,22 @@ class C4dRenderSettings(zync_threading.MainThreadCaller):
     else:
       raise C4dRenderFormatUnsupportedException(
         'Multi-pass image output format not supported. Supported formats: ' +
-        ', '.join(self.supported_formats.values()))
+        self._supported_formats_str)
+
+  @main_thread
+  def get_submit_snapshot(self):
+    """
+    Returns render data values checked on job submission, read in a single main thread call.
+
+    :return dict[str,Any]: Frame rate and image saving flags.
+    """
+    return {
+      'frame_rate': self._render_data[c4d.RDATA_FRAMERATE],
+      'saving_globally_enabled': self._render_data[c4d.RDATA_GLOBALSAVE],
+      'image_saving_enabled': self._render_data[c4d.RDATA_SAVEIMAGE],
+      'multipass_image_saving_enabled': self._render_data[c4d.RDATA_MULTIPASS_SAVEIMAGE] and
+                                        self._render_data[c4d.RDATA_MULTIPASS_ENABLE],
+    }
 
   @main_thread
   def get_multipass_image_path(self):
@@ -276,13 +294,20 @@ class C4dRenderSettings(zync_threading.MainThreadCaller):
     """
     return bool(self.get_multipass_image_path())
 
-  @main_thread
   def is_saving_globally_enabled(self):
     """
     Checks if saving is enabled globally.
 
+    The value is read once and reused for the lifetime of this object.
+
     :return bool:
     """
+    if self._saving_globally_enabled is None:
+      self._saving_globally_enabled = self._read_saving_globally_enabled()
+    return self._saving_globally_enabled
+
+  @main_thread
+  def _read_saving_globally_enabled(self):
     return self._render_data[c4d.RDATA_GLOBALSAVE]
 
   @main_thread
@@ -349,3 +374,21 @@ class C4dRenderSettings(zync_threading.MainThreadCaller):
       if value is not None:
         state[key] = value
     return state
+
+  @main_thread
+  def swap_state(self, state):
+    """
+    Sets the state of render data from dict and returns the previous values of the same fields.
+
+    If setting the state fails, the previous values are restored before the error is re-raised.
+
+    :param dict[Any,Any] state:
+    :return dict[Any,Any]:
+    """
+    previous_state = self.get_state(state.keys())
+    try:
+      self.set_state(state)
+    except:
+      self.set_state(previous_state)
+      raise
+    return previous_state
@@ -1,7 +1,6 @@
 """ Contains C4dSceneSettings class. """
 
 from importlib import import_module
-import re
 
 from zync_c4d_take_settings import C4dTakeSettings
 import zync_c4d_utils
@@ -10,7 +9,7 @@ zync_threading = zync_c4d_utils.import_zync_module('zync_threading')
 main_thread = zync_threading.MainThreadCaller.main_thread
 c4d = import_module('c4d')
 
-win_drive_letter_regex = re.compile('^[a-zA-Z]:$')
+_IS_WINDOWS = zync_c4d_utils.is_windows()
 
 
 class C4dSceneSettings(zync_threading.MainThreadCaller):
@@ -43,15 +42,14 @@ class C4dSceneSettings(zync_threading.MainThreadCaller):
     """
     take_settings = []
     take_data = self._document.GetTakeData()
-
-    def _traverse(take, depth):
+    # Depth-first, children pushed in reverse so takes keep their hierarchy order.
+    pending_takes = [(take_data.GetMainTake(), 0)]
+    while pending_takes:
+      take, depth = pending_takes.pop()
       take_settings.append(
           C4dTakeSettings(self._main_thread_executor, take, take_data, depth,
                           self._document))
-      for child_take in take.GetChildren():
-        _traverse(child_take, depth + 1)
-
-    _traverse(take_data.GetMainTake(), 0)
+      pending_takes.extend((child_take, depth + 1) for child_take in reversed(take.GetChildren()))
     return take_settings
 
   @main_thread
@@ -72,14 +70,6 @@ class C4dSceneSettings(zync_threading.MainThreadCaller):
     """
     return self._document.GetDocumentName()
 
-  def get_scene_name_without_extension(self):
-    """
-    Returns name of the scene without extension.
-
-    :return str:
-    """
-    return re.sub(r'\.c4d$', '', self.get_scene_name())
-
   @main_thread
   def get_scene_path(self):
     """
@@ -94,8 +84,10 @@ class C4dSceneSettings(zync_threading.MainThreadCaller):
     # When path is just a drive letter on Windows, it has no trailing \ character and such path
     # can't be merged correctly with file name, because on Windows C:\directory is different thing
     # than C:directory and both are valid paths. This method appends missing \ character.
-    if zync_c4d_utils.is_windows():
-      if win_drive_letter_regex.match(path):
+    # Separators are normalized as well, so the same directory is always spelled the same way.
+    if _IS_WINDOWS:
+      path = path.replace('/', '\\')
+      if len(path) == 2 and path[1] == ':' and path[0].isalpha():
         path += '\\'
     return path
 
@@ -120,4 +112,4 @@ class C4dSceneSettings(zync_threading.MainThreadCaller):
 
     :return bool:
     """
-    return self.get_scene_path() != '' and not self._document.GetChanged()
+    return self._document.GetDocumentPath() != '' and not self._document.GetChanged()
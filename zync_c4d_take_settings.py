@@ -27,19 +27,18 @@ class C4dTakeSettings(zync_threading.MainThreadCaller):
     self._take_name = take.GetName()
     self._take_indented_name = take_depth * ' ' + self._take_name
     self._document = document
+    # Instances are created on the main thread, so the rest of the take state is read upfront.
+    camera = take.GetCamera(take_data)
+    self._camera_name = camera.GetName() if camera else ''
+    self._is_valid = take.GetEffectiveRenderData(take_data) is not None
 
-  @main_thread
   def get_camera_name(self):
     """
     Returns the camera name.
 
     :return str:
     """
-    camera = self._take.GetCamera(self._take_data)
-    if camera:
-      return camera.GetName()
-    else:
-      return ''
+    return self._camera_name
 
   def get_indented_name(self):
     """
@@ -68,11 +67,10 @@ class C4dTakeSettings(zync_threading.MainThreadCaller):
                              self._take.GetEffectiveRenderData(self._take_data)[0], self._document,
                              self._take)
 
-  @main_thread
   def is_valid(self):
     """
     Checks if take is valid.
 
     :return bool:
     """
-    return self._take.GetEffectiveRenderData(self._take_data) is not None
+    return self._is_valid
@@ -12,7 +12,17 @@ from zync_c4d_constants import PLUGIN_DIR
 
 c4d = import_module('c4d')
 
+try:
+  _text = unicode
+  _str_types = basestring
+except NameError:
+  _text = str
+  _str_types = str
+
+_analytics = None
 _site_code = None
+_site_code_read = False
+_config_cache = {}
 
 
 def get_c4d_version():
@@ -21,14 +31,15 @@ def get_c4d_version():
 
   :return str:
   """
-  return 'r%d.%03d' % (c4d.GetC4DVersion() / 1000, c4d.GetC4DVersion() % 1000)
+  version = c4d.GetC4DVersion()
+  return 'r%d.%03d' % (version // 1000, version % 1000)
 
 
 def to_unicode(value):
   # It seems that c4d python uses utf for str objects.
   # https://plugincafe.maxon.net/topic/11943/how-to-handle-c4d-unicode-in-python-scripting
   try:
-    return unicode(value)
+    return _text(value)
   except UnicodeDecodeError:
     return str(value)
 
@@ -68,22 +79,28 @@ def import_zync_module(zync_module_name):
 
 
 def _import_zync_module(zync_module_name):
-  old_sys_path = list(sys.path)
-
+  zync_module = sys.modules.get(zync_module_name)
+  if zync_module is not None:
+    return zync_module
+  api_dir = _get_api_dir()
+  added = api_dir not in sys.path
+  if added:
+    sys.path.append(api_dir)
   try:
-    sys.path.append(_get_api_dir())
     return import_module(zync_module_name)
   finally:
-    sys.path = old_sys_path
+    if added and api_dir in sys.path:
+      sys.path.remove(api_dir)
 
 
 def _get_api_dir():
-  if os.environ.get('ZYNC_API_DIR'):
-    return os.environ.get('ZYNC_API_DIR')
+  env_api_dir = os.environ.get('ZYNC_API_DIR')
+  if env_api_dir:
+    return env_api_dir
   else:
     config_c4d = _get_c4d_config()
     api_dir = config_c4d.API_DIR
-    if not isinstance(api_dir, basestring):
+    if not isinstance(api_dir, _str_types):
       raise Exception('API_DIR defined in config_c4d.py is not a string')
     return api_dir
 
@@ -94,14 +111,24 @@ def _get_c4d_config():
     raise Exception(
         'Plugin configuration incomplete: zync-python path not provided.\n\n'
         'Re-installing the plugin may solve the problem.')
-  import imp
-  return imp.load_source('config_c4d', config_path)
+  return _load_config('config_c4d', config_path)
 
 
 def _get_zync_config():
   api_dir = _get_api_dir()
+  return _load_config('zync_config', os.path.join(api_dir, 'zync_config.py'))
+
+
+def _load_config(module_name, config_path):
+  # Config files are only re-executed when they were modified since they were last loaded.
+  mtime = os.stat(config_path).st_mtime
+  cached = _config_cache.get(config_path)
+  if cached is not None and cached[0] == mtime:
+    return cached[1]
   import imp
-  return imp.load_source('zync_config', os.path.join(api_dir, 'zync_config.py'))
+  config = imp.load_source(module_name, config_path)
+  _config_cache[config_path] = (mtime, config)
+  return config
 
 
 def post_plugin_error(trace):
@@ -111,12 +138,30 @@ def post_plugin_error(trace):
   :param str trace:
   """
   try:
-    analytics.post_plugin_error_event(_site_code, 'c4d', get_c4d_version(),
-                                      plugin_version.__version__, trace)
+    _get_analytics().post_plugin_error_event(_get_site_code(), 'c4d', get_c4d_version(),
+                                             plugin_version.__version__, trace)
   except BaseException as err:
     print('Exception %s when submitting error stacktrace:\n %s' % (err, trace))
 
 
+def _get_analytics():
+  global _analytics
+  if _analytics is None:
+    _analytics = _import_zync_module('analytics')
+  return _analytics
+
+
+def _get_site_code():
+  global _site_code, _site_code_read
+  if not _site_code_read:
+    _site_code_read = True
+    try:
+      _site_code = _get_zync_config().ZYNC_URL
+    except BaseException as err:
+      print('Exception %s when getting site code:\n %s' % (err, traceback.format_exc()))
+  return _site_code
+
+
 def init_c4d_resources():
   """
   Initializes and returns a C4D resource.
@@ -137,13 +182,4 @@ def is_windows():
 
   :return bool:
   """
-  import sys
   return sys.platform == 'win32'
-
-
-analytics = _import_zync_module('analytics')
-try:
-  _site_code = _get_zync_config().ZYNC_URL
-except BaseException as err:
-  post_plugin_error(traceback.format_exc())
-  print('Exception %s when getting site code' % err)
@@ -1,5 +1,5 @@
+import glob
 from importlib import import_module
-import os
 
 from zync_c4d_render_settings import C4dRenderingFailedException
 from zync_c4d_utils import import_zync_module
@@ -11,6 +11,26 @@ main_thread_ignore_interrupts = \
   zync_threading.InterruptibleMainThreadCaller.main_thread_ignore_interrupts
 c4d = import_module('c4d')
 
+# V-Ray bridge settings for stand-alone export, except for the output file name.
+_VRAY_EXPORT_TEMPLATE = (
+  (c4d.VP_VRAYBRIDGE_TR_SEPARATE_FILES, 0),
+  (c4d.VP_VRAYBRIDGE_TR_TRANS_HEX, 1),
+  (c4d.VP_VRAYBRIDGE_VFB_IMAGE_SAVE, 0),
+  (c4d.VP_VRAYBRIDGE_TR_PER_FRAME, 0),
+  (c4d.VP_VRAYBRIDGE_TR_RENDER, 0),
+  (c4d.VP_VB_RESUMABLERENDER_ENABLE, 0),
+  (c4d.VP_VRAYBRIDGE_TR_COMPRESSED, 1),
+  (c4d.VP_VRAYBRIDGE_TR_EXPORT, 1),
+  (c4d.VP_VRAYBRIDGE_TR_EXPORT_GEOM, 1),
+  (c4d.VP_VRAYBRIDGE_TR_EXPORT_LIGHT, 1),
+  (c4d.VP_VRAYBRIDGE_TR_EXPORT_MATS, 1),
+  (c4d.VP_VRAYBRIDGE_TR_EXPORT_TEXTURES, 1),
+  (c4d.VP_VRAYBRIDGE_TR_RENDER_EXT, 0),
+  (c4d.VP_VRAYBRIDGE_TR_MESH_HEX, 1),
+  (c4d.VP_VRAYBRIDGE_VFB_MIRROR_CHANNELS, 0),
+  (c4d.VP_VB_SHOW_VFB_WINDOW, 0),
+)
+
 
 class VRayExporter(zync_threading.InterruptibleMainThreadCaller):
   """
@@ -42,6 +62,7 @@ class VRayExporter(zync_threading.InterruptibleMainThreadCaller):
     self._send_vray_job = send_vray_job
     self._saved_render_settings = None
     self._saved_vray_settings = None
+    self._vray_settings = None
 
   def run(self):
     """ Executes stand-alone export and calls the callback that sends a V-Ray job to Zync. """
@@ -66,7 +87,7 @@ class VRayExporter(zync_threading.InterruptibleMainThreadCaller):
     # Nothing will be rendered as we disabled rendering in prepare_settings and enabled export.
     try:
       self._render_settings.render()
-      if not os.listdir(os.path.dirname(self._vrscene_path)):
+      if next(glob.iglob(self._vrscene_path + '*'), None) is None:
         raise zync.ZyncError(
           'Unable to export vray scene. Exported file(s) %s not found' % self._vrscene_path)
     except C4dRenderingFailedException as err:
@@ -78,28 +99,10 @@ class VRayExporter(zync_threading.InterruptibleMainThreadCaller):
     Saves the current V-Ray render settings and replaces them with a configuration
     for stand-alone exporting.
     """
-    vray_bridge_export_state = {
-      c4d.VP_VRAYBRIDGE_TR_SEPARATE_FILES: 0,
-      c4d.VP_VRAYBRIDGE_TR_TRANS_HEX: 1,
-      c4d.VP_VRAYBRIDGE_VFB_IMAGE_SAVE: 0,
-      c4d.VP_VRAYBRIDGE_TR_PER_FRAME: 0,
-      c4d.VP_VRAYBRIDGE_TR_RENDER: 0,
-      c4d.VP_VB_RESUMABLERENDER_ENABLE: 0,
-      c4d.VP_VRAYBRIDGE_TR_COMPRESSED: 1,
-      c4d.VP_VRAYBRIDGE_TR_EXPORT: 1,
-      c4d.VP_VRAYBRIDGE_TR_EXPORT_GEOM: 1,
-      c4d.VP_VRAYBRIDGE_TR_EXPORT_LIGHT: 1,
-      c4d.VP_VRAYBRIDGE_TR_EXPORT_MATS: 1,
-      c4d.VP_VRAYBRIDGE_TR_EXPORT_TEXTURES: 1,
-      c4d.VP_VRAYBRIDGE_TR_RENDER_EXT: 0,
-      c4d.VP_VRAYBRIDGE_TR_MESH_HEX: 1,
-      c4d.VP_VRAYBRIDGE_VFB_MIRROR_CHANNELS: 0,
-      c4d.VP_VB_SHOW_VFB_WINDOW: 0,
-      c4d.VP_VRAYBRIDGE_TR_FILE_NAME: self._vrscene_path,
-    }
-    vray_settings = self._render_settings.get_vray_settings()
-    self._saved_vray_settings = vray_settings.get_state(vray_bridge_export_state.keys())
-    vray_settings.set_state(vray_bridge_export_state)
+    vray_bridge_export_state = dict(_VRAY_EXPORT_TEMPLATE)
+    vray_bridge_export_state[c4d.VP_VRAYBRIDGE_TR_FILE_NAME] = self._vrscene_path
+    self._vray_settings = self._render_settings.get_vray_settings()
+    self._saved_vray_settings = self._vray_settings.swap_state(vray_bridge_export_state)
 
     fps = self._scene_settings.get_fps()
     render_settings_export_state = {
@@ -112,13 +115,11 @@ class VRayExporter(zync_threading.InterruptibleMainThreadCaller):
       c4d.RDATA_MULTIPASS_SAVEIMAGE: False,
     }
 
-    self._saved_render_settings = self._render_settings.get_state(
-      render_settings_export_state.keys())
-    self._render_settings.set_state(render_settings_export_state)
+    self._saved_render_settings = self._render_settings.swap_state(render_settings_export_state)
 
   @main_thread_ignore_interrupts
   def _maybe_restore_settings(self):
     if self._saved_vray_settings is not None:
-      self._render_settings.get_vray_settings().set_state(self._saved_vray_settings)
+      self._vray_settings.set_state(self._saved_vray_settings)
     if self._saved_render_settings is not None:
       self._render_settings.set_state(self._saved_render_settings)
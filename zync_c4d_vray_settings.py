@@ -1,6 +1,7 @@
 """ Contains C4dVraySettings class. """
 import glob
 from importlib import import_module
+import itertools
 import re
 
 import zync_c4d_utils
@@ -9,6 +10,10 @@ zync_threading = zync_c4d_utils.import_zync_module('zync_threading')
 main_thread = zync_threading.MainThreadCaller.main_thread
 c4d = import_module('c4d')
 
+_VRAY_EXPORTED_RE = re.compile('Exported by V-Ray (?P<major>\\d)\\.(?P<minor>\\d+)')
+_VRAY_CORE_RE = re.compile(
+  'V-Ray core version is (?P<major>\\d)\\.(?P<minor>\\d{2})\\.(?P<patch>\\d{2})')
+
 
 class C4dVrayVersionException(Exception):
   """
@@ -57,27 +62,23 @@ class C4dVraySettings(zync_threading.MainThreadCaller):
     :raises:
       C4dVrayVersionException: if version can't be determined.
     """
-    version_files = glob.glob(vrscene_path + '*')
-    if not version_files:
+    version_file = next(glob.iglob(vrscene_path + '*'), None)
+    if version_file is None:
       print 'Cannot determine vray version from %s' % vrscene_path
       raise C4dVrayVersionException(
         'Unable to determine V-Ray version. Exported vrscene file was not found.')
 
-    version_file = list(version_files)[0]
     with open(version_file) as myfile:
-      head = [next(myfile) for _ in xrange(10)]
-    first_10_lines = '\n'.join(head)
+      first_10_lines = ''.join(itertools.islice(myfile, 10))
 
     # Version numbers written by exporter may be inconsistent, for example
     # V-Ray 3.7 writes both lines:
     # // V-Ray core version is 3.60.05
     # // Exported by V-Ray 3.7
-    match = re.search('Exported by V-Ray (?P<major>\\d)\\.(?P<minor>\\d+)', first_10_lines)
+    match = _VRAY_EXPORTED_RE.search(first_10_lines)
     if match:
       return match.group('major') + '.' + match.group('minor')
-    match = re.search(
-      'V-Ray core version is (?P<major>\\d)\\.(?P<minor>\\d{2})\\.(?P<patch>\\d{2})',
-      first_10_lines)
+    match = _VRAY_CORE_RE.search(first_10_lines)
     if match:
       return match.group('major') + '.' + match.group('minor') + '.' + match.group('patch')
     print 'Vray scene header: %s' % first_10_lines
@@ -118,9 +119,10 @@ class C4dVraySettings(zync_threading.MainThreadCaller):
 
     :param dict[Any,Any] state:
     """
+    set_field = self._vray_bridge.__setitem__
     for key, value in state.items():
       if value is not None:
-        self._vray_bridge[key] = value
+        set_field(key, value)
 
   @main_thread
   def get_state(self, vray_bridge_fields_to_save):
@@ -130,9 +132,23 @@ class C4dVraySettings(zync_threading.MainThreadCaller):
     :param collections.Iterable[Any] vray_bridge_fields_to_save: A collection of fields to save.
     :return dict[Any,Any]:
     """
-    state = dict()
-    for key in vray_bridge_fields_to_save:
-      value = self._vray_bridge[key]
-      if value is not None:
-        state[key] = value
-    return state
+    values = ((key, self._vray_bridge[key]) for key in vray_bridge_fields_to_save)
+    return {key: value for key, value in values if value is not None}
+
+  @main_thread
+  def swap_state(self, state):
+    """
+    Sets the state of vray bridge from dict and returns the previous values of the same fields.
+
+    If setting the state fails, the previous values are restored before the error is re-raised.
+
+    :param dict[Any,Any] state:
+    :return dict[Any,Any]:
+    """
+    previous_state = self.get_state(state.keys())
+    try:
+      self.set_state(state)
+    except:
+      self.set_state(previous_state)
+      raise
+    return previous_state